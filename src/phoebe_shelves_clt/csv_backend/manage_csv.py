@@ -166,17 +166,12 @@ def edit_author(model: CSVDataModel, author_id: int):
         model: Current CSVDataModel instance
         author_id: ID of the author entry to edit.
     """
-    cols_dict = {
-        "First Name": "first_name",
-        "Middle Name": "middle_name",
-        "Last Name": "last_name",
-        "Suffix": "suffix"
-    }
-
     print("\nWhich author property would you like to modify?")
-    col_select = inputs.prompt_from_choices(list(cols_dict.keys()))
+    col_select = inputs.prompt_from_choices(list(inputs.AUTHOR_PROPS.keys()),
+                                            inputs.AUTHOR_PROPS_PROMPT)
     new_value = input(f"\nWhat is the new {col_select.lower()}?: ")
-    model.edit_entry("authors", "id", author_id, cols_dict[col_select], new_value)
+    model.edit_entry("authors", "id", author_id,
+                     inputs.AUTHOR_PROPS[col_select], new_value)
 
 
 def delete_author(model: CSVDataModel, author_id: int):
@@ -279,9 +274,9 @@ def edit_book(model:CSVDataModel, book_id: int):
         model: Current CSVDataModel instance
         book_id: ID of the book entry to modify.
     """
-    cols = ["Title", "Author", "Pages", "Rating", "Genre"]
-    print("\nWhich author property would you like to modify?")
-    col_select = inputs.prompt_from_choices(cols)
+    print("\nWhich book property would you like to modify?")
+    col_select = inputs.prompt_from_choices(inputs.BOOK_PROPS,
+                                            inputs.BOOK_PROPS_PROMPT)
 
     if col_select == "Title":
         new_title = input("\nWhat is the new title?: ")
@@ -480,9 +475,9 @@ def edit_reading_entry(model: CSVDataModel, title: str, id_list: List[int]):
     edit_id = inputs.prompt_from_choices(id_list, "Choose an entry to edit: ",
                                          zero_indexed=True, use_index=False)
 
-    prop_opts = ["Title", "Start", "Finish", "Rating"]
     print("\nWhich property would you like to edit?")
-    prop_select = inputs.prompt_from_choices(prop_opts)
+    prop_select = inputs.prompt_from_choices(inputs.READING_PROPS,
+                                             inputs.READING_PROPS_PROMPT)
 
     if prop_select == "Title":
         _, book_id = select_book(model)
@@ -116,7 +116,7 @@ def main(db_select: str, mode: str, model: CSVDataModel):
         db = model.generate_main_books()
     
     if mode == "table":
-        print_table(db.fillna(""))
+        print_table(db.astype(object).fillna(""))
     elif mode == "chart":
         # TODO: Implement chart visualization
         # ? TEMP TABLE: books_friendly/reading_friendly
@@ -73,14 +73,15 @@ def init_module(backend: str, force_overwrite: bool, **kwargs):
     """
     if backend == "csv":
         data_directory = kwargs["data_directory"]
-        books_path = data_directory + "/backend/books.csv"
-        reading_path = data_directory + "/backend/reading.csv"
-        authors_path = data_directory + "/backend/authors.csv"
-        genres_path = data_directory + "/backend/genres.csv"
-        series_path = data_directory + "/backend/series.csv"
-        books_authors_path = data_directory + "/backend/books_authors.csv"
-        books_genres_path = data_directory + "/backend/books_genres.csv"
-        books_series_path = data_directory + "/backend/books_series.csv"
+        backend_directory = os.path.join(data_directory, "backend")
+        books_path = os.path.join(backend_directory, "books.csv")
+        reading_path = os.path.join(backend_directory, "reading.csv")
+        authors_path = os.path.join(backend_directory, "authors.csv")
+        genres_path = os.path.join(backend_directory, "genres.csv")
+        series_path = os.path.join(backend_directory, "series.csv")
+        books_authors_path = os.path.join(backend_directory, "books_authors.csv")
+        books_genres_path = os.path.join(backend_directory, "books_genres.csv")
+        books_series_path = os.path.join(backend_directory, "books_series.csv")
 
         books_cols = ["id", "title", "book_length", "rating"]
         create_database(books_path, 'books', books_cols, force_overwrite)
@@ -135,5 +135,6 @@ def manage_module(backend: str, db_select: str, mode: str, **kwargs):
     if backend == "csv":
         model = data_model.CSVDataModel(kwargs["data_directory"])
         manage_csv.main(db_select, mode, model)
+        model.save()
     else:
         manage_sql.main(db_select, mode, kwargs["sql_configs"])
\ No newline at end of file
@@ -186,19 +186,14 @@ def edit_author(conn, author_id: int):
         conn (psycopg2.connection): Connection to the PostgreSQL database.
         author_id: ID of the author entry to edit.
     """
-    cols_dict = {
-        "First Name": "first_name",
-        "Middle Name": "middle_name",
-        "Last Name": "last_name",
-        "Suffix": "suffix"
-    }
-
     print("\nWhich author property would you like to modify?")
-    col_select = inputs.prompt_from_choices(list(cols_dict.keys()))
+    col_select = inputs.prompt_from_choices(list(inputs.AUTHOR_PROPS.keys()),
+                                            inputs.AUTHOR_PROPS_PROMPT)
     new_value = input(f"\nWhat is the new {col_select.lower()}?: ")
-    query = (f"UPDATE authors SET {cols_dict[col_select]} = '{new_value}' "
+    col_name = inputs.AUTHOR_PROPS[col_select]
+    query = (f"UPDATE authors SET {col_name} = '{new_value}' "
               "WHERE id = {author_id}")
-    query = sql_api.read_query("update_author").format(cols_dict[col_select],
+    query = sql_api.read_query("update_author").format(col_name,
                                                        new_value, author_id)
     sql_api.execute_query(conn, query, "modify")
 
@@ -308,9 +303,9 @@ def edit_book(conn, book_id: int):
         conn (psycopg2.connection): Connection to the PostgreSQL database.
         book_id: ID of the book entry to modify.
     """
-    cols = ["Title", "Author", "Pages", "Rating", "Genre"]
-    print("\nWhich author property would you like to modify?")
-    col_select = inputs.prompt_from_choices(cols)
+    print("\nWhich book property would you like to modify?")
+    col_select = inputs.prompt_from_choices(inputs.BOOK_PROPS,
+                                            inputs.BOOK_PROPS_PROMPT)
     if col_select == "Title":
         new_title = input("\nWhat is the new title?: ")
         query = sql_api.read_query("update_book").format("title",
@@ -523,9 +518,9 @@ def edit_reading_entry(conn, title: str, id_list: List[int]):
     edit_id = inputs.prompt_from_choices(id_list, "Choose an entry to edit: ",
                                          zero_indexed=True, use_index=False)
 
-    prop_opts = ["Title", "Start", "Finish", "Rating"]
     print("\nWhich property would you like to edit?")
-    prop_select = inputs.prompt_from_choices(prop_opts)
+    prop_select = inputs.prompt_from_choices(inputs.READING_PROPS,
+                                             inputs.READING_PROPS_PROMPT)
 
     if prop_select == "Title":
         title, book_id = select_book(conn)
@@ -4,12 +4,16 @@ This module provides the classes and functions that encompass the backend
 data. This is primarily used to provide a more concise way of interacting
 with the CSV backend that can simulate similar programming patterns as
 interacting with the SQL backend.
+
+Todos:
+    * Evaluate a typed, columnar storage format (e.g. Parquet) for the backend
+      tables, keeping CSV as an export option
 """
 
-from typing import Dict, List, Set, Tuple, Union
+import os
+from typing import Any, Dict, List, Set, Tuple, Union
 
 import pandas as pd
-import numpy as np
 
 # Type Aliases
 DataFrame = pd.DataFrame
@@ -25,6 +29,11 @@ class CSVDataModel:
         model_paths (Dict[str: str]): Dictionary of table names to the path
             of the underlying CSV.
         csv_list (List[str]): List of the component CSV file names.
+        cache (Dict[str: Dict[str: Any]]): Dictionary of table names to values
+            derived from that table. Entries are dropped whenever the
+            underlying table is modified.
+        dirty (Set[str]): Names of the tables modified since they were last
+            saved to their CSV.
     """
 
     def __init__(self, data_directory: str):
@@ -39,6 +48,8 @@ class CSVDataModel:
         """
         self.data_directory = data_directory
         self.model_data, self.model_paths = self.load_model()
+        self.cache: Dict[str, Dict[str, Any]] = {}
+        self.dirty: Set[str] = set()
 
     def load_model(self) -> Tuple[Dict[str, DataFrame], Dict[str, str]]:
         """ Read in all component CSV tables
@@ -57,22 +68,67 @@ class CSVDataModel:
         """
         model_data = {}
         model_paths = {}
+        backend_directory = os.path.join(self.data_directory, "backend")
 
         for name in self.csv_list:
-            path = f"{self.data_directory}/backend/{name}.csv"
+            path = os.path.join(backend_directory, f"{name}.csv")
             model_paths[name] = path
-            model_data[name] = pd.read_csv(path)
+            model_data[name] = pd.read_csv(\
+                path, dtype=self.column_dtypes.get(name),
+                parse_dates=self.date_columns.get(name, False))
 
             # Need to fill NA for string concatenation later on
             if name == "authors":
                 model_data[name].fillna("", inplace=True)
 
+            model_data[name] = self.cast_columns(name, model_data[name])
+
     
         return(model_data, model_paths)
 
     csv_list = ["authors", "books", "genres", "reading", "series",
                 "books_authors", "books_genres", "books_series"]
 
+    # Explicit column dtypes so pandas can skip type inference on read. Columns
+    # used for exact-match filters are stored with the "string" dtype and
+    # optional numeric columns use the nullable "Int64"/"Float64" dtypes.
+    column_dtypes = {
+        "authors": {"id": "int64", "last_name": "string"},
+        "books": {"id": "int64", "title": "string", "book_length": "Int64",
+                  "rating": "Float64"},
+        "genres": {"id": "int64", "name": "string"},
+        "reading": {"id": "int64", "book_id": "int64", "rating": "Float64"},
+        "series": {"id": "int64", "name": "string"},
+        "books_authors": {"book_id": "int64", "author_id": "int64"},
+        "books_genres": {"book_id": "int64", "genre_id": "int64"},
+        "books_series": {"book_id": "int64", "series_id": "int64"}
+    }
+
+    # Columns parsed as datetimes when the CSV is read
+    date_columns = {"reading": ["start_date", "finish_date"]}
+
+    def cast_columns(self, table: str, data: DataFrame) -> DataFrame:
+        """ Cast the columns of a table to their expected dtypes
+
+        Casts the columns of a table to the dtypes in column_dtypes and any
+        date columns that are not already datetimes (e.g. after adding or
+        editing an entry with a date or string value) to datetime64.
+
+        Args:
+            self: The current CSVDataModel instance.
+            table: Name of the table the data belongs to.
+            data: DataFrame representation of the table.
+
+        Returns:
+            The DataFrame with its columns cast to the appropriate dtypes.
+        """
+        data = data.astype(self.column_dtypes.get(table, {}), copy=False)
+
+        for column in self.date_columns.get(table, []):
+            if not pd.api.types.is_datetime64_any_dtype(data[column]):
+                data[column] = pd.to_datetime(data[column])
+        return(data)
+
     ### --------------------- Retrieve basic lists ------------------------ ###
 
     def get_authors_dict(self, selection: str = None) -> Dict[str, int]:
@@ -110,16 +166,14 @@ class CSVDataModel:
         Todo:
             * Update documentation
         """
-        books_dict = dict(zip(self.model_data["books"]["title"],
-                        self.model_data["books"]["id"]))
+        books_dict = self.get_lookup_dict("books", "title")
 
-        if selection is not None:
-            books_dict = {title:book_id
-                          for title, book_id
-                          in books_dict.items()
-                          if title == selection}
-
-        return(books_dict)
+        if selection is None:
+            return(dict(books_dict))
+        elif selection in books_dict:
+            return({selection: books_dict[selection]})
+        else:
+            return({})
 
     def get_genres_dict(self, selection: str = None) -> Dict[str, int]:
         """ Retrieve dictionary of genres.
@@ -137,16 +191,36 @@ class CSVDataModel:
         Todo:
             * Update documentation
         """
-        genres_dict = dict(zip(self.model_data["genres"]["name"],
-                        self.model_data["genres"]["id"]))
-        
-        if selection is not None:
-            genres_dict = {genre:genre_id
-                        for genre, genre_id
-                        in genres_dict.items()
-                        if genre == selection}
+        genres_dict = self.get_lookup_dict("genres", "name")
+
+        if selection is None:
+            return(dict(genres_dict))
+        elif selection in genres_dict:
+            return({selection: genres_dict[selection]})
+        else:
+            return({})
+
+    def get_lookup_dict(self, table: str, column: str) -> Dict[Any, int]:
+        """ Retrieve a cached mapping from a column's values to entry ID's.
+
+        Builds a dictionary mapping the values of a column to their entry ID's
+        the first time it is requested and reuses it until the table is
+        modified. This turns repeated exact-match lookups (e.g. checking if a
+        title exists) into a single hash lookup instead of a full scan.
 
-        return(genres_dict)
+        Args:
+            self: Current CSVDataModel instance.
+            table: Name of the table to map.
+            column: Column whose values are used as the keys.
+
+        Returns:
+            Dictionary mapping from the column values to their entry ID's.
+        """
+        table_cache = self.cache.setdefault(table, {})
+        if column not in table_cache:
+            table_cache[column] = dict(zip(self.model_data[table][column],
+                                           self.model_data[table]["id"]))
+        return(table_cache[column])
 
     def get_reading_entries(self, selection: int = None) -> List[int]:
         entries = self.model_data["reading"]
@@ -183,8 +257,6 @@ class CSVDataModel:
         books_authors_merged = self.create_book_authors_merge()
         books_genres_merged = self.create_books_genres_merge()
         books_reading_agg = self.create_books_reading_agg()
-        main_books = self.model_data["books"].copy()
-
 
         # Merge aggregates into the final
         main_books = pd.merge(self.model_data["books"],
@@ -197,10 +269,9 @@ class CSVDataModel:
         main_books = pd.merge(main_books, books_reading_agg,
                               left_on="id", right_on="book_id",
                               how="left")
-        main_books["times_read"] = main_books.apply(lambda row:\
-            0 if np.isnan(row.times_read) else row.times_read, axis=1)
-        main_books["Rating"] = main_books.apply(lambda row: \
-            row.rating if np.isnan(row.avg_rating) else row.avg_rating, axis=1)
+        main_books["times_read"] = main_books["times_read"].fillna(0)
+        main_books["Rating"] = main_books["avg_rating"].fillna(\
+            main_books["rating"])
         main_books.rename(columns={"id": "ID", "title": "Title",
                                    "book_length": "Pages", "Genre": "Genres",
                                    "times_read": "Times Read"},
@@ -209,20 +280,18 @@ class CSVDataModel:
         if filter is None:
             pass
         elif filter == "Author":
-            data_filter = main_books["author_id"].apply(lambda authors: \
-                self.check_all_in_set(kwargs["id_list"], authors))
-            main_books = main_books[data_filter]
+            book_ids = self.get_linked_books("books_authors", "author_id",
+                                             kwargs["id_list"])
+            main_books = main_books[main_books["ID"].isin(book_ids)]
 
         elif filter == "Genre":
-            data_filter = main_books["genre_id"].apply(lambda genres: \
-                self.check_all_in_set(kwargs["id_list"], genres))
-            main_books = main_books[data_filter]
+            book_ids = self.get_linked_books("books_genres", "genre_id",
+                                             kwargs["id_list"])
+            main_books = main_books[main_books["ID"].isin(book_ids)]
 
         elif filter == "Title":
             #! This approach can be expanded to accept multiple titles
-            data_filter = main_books["ID"].apply(lambda title: \
-                title in kwargs["id_list"])
-            main_books = main_books[data_filter]
+            main_books = main_books[main_books["ID"].isin(kwargs["id_list"])]
 
         elif filter == "Rating":
             data_filter = self.numeric_filter(\
@@ -246,7 +315,6 @@ class CSVDataModel:
                             "Pages", "Times Read", "Genres"]
         main_books = main_books.reindex(columns=new_column_order)  # type: ignore
         main_books.set_index("ID", inplace=True)
-        main_books.sort_values("Title")
         return(main_books)
 
     def generate_main_reading(self, filter: str = None,
@@ -279,11 +347,7 @@ class CSVDataModel:
                                 left_on="book_id", right_on="id"
                                 ).drop(columns=["id_y"])
 
-        # Date-based columns require some type processing
-        main_reading["start_date"] = pd.to_datetime(main_reading["start_date"]).dt.date
-        main_reading["finish_date"] = pd.to_datetime(main_reading["finish_date"]).dt.date
-        main_reading["read_time"] = (main_reading["finish_date"] - main_reading["start_date"]).dt.days
-        main_reading.round({"read_time": 0})
+        main_reading["read_time"] = self.calculate_read_time(main_reading)
 
         main_reading.rename(columns={"id_x": "ID", "start_date": "Start",
                                      "finish_date": "Finish",
@@ -294,15 +358,14 @@ class CSVDataModel:
         if filter is None:
             pass
         elif filter == "Author":
-            data_filter = main_reading["author_id"].apply(lambda authors: \
-                self.check_all_in_set(kwargs["id_list"], authors))
-            main_reading = main_reading[data_filter]
+            book_ids = self.get_linked_books("books_authors", "author_id",
+                                             kwargs["id_list"])
+            main_reading = main_reading[main_reading["book_id"].isin(book_ids)]
 
         elif filter == "Title":
             #! This approach can be expanded to accept multiple titles
-            data_filter = main_reading["book_id"].apply(lambda title: \
-                title in kwargs["id_list"])
-            main_reading = main_reading[data_filter]
+            main_reading = main_reading[\
+                main_reading["book_id"].isin(kwargs["id_list"])]
 
         elif filter == "Start":
             data_filter = self.date_filter(\
@@ -331,7 +394,14 @@ class CSVDataModel:
         new_col_order = ["ID", "Title", "Author(s)", "Start", "Finish", "Rating", "Read Time"]
         main_reading = main_reading.reindex(columns=new_col_order)  # type: ignore
         main_reading.set_index("ID", inplace=True)
-        main_reading.sort_values("Finish", inplace=True)
+
+        # Entries are usually added in order, so only sort when needed
+        if not main_reading["Finish"].is_monotonic_increasing:
+            main_reading.sort_values("Finish", inplace=True)
+
+        # Only convert to plain dates once filtering is done, for display
+        main_reading["Start"] = main_reading["Start"].dt.date
+        main_reading["Finish"] = main_reading["Finish"].dt.date
         return(main_reading)
 
 
@@ -350,19 +420,32 @@ class CSVDataModel:
             authors_formatted: DataFrame consisting of the author ID and the
                 formatted name.
         """
-        authors_formatted = self.model_data["authors"].copy()
+        authors = self.model_data["authors"]
         if selection is not None:
-            authors_formatted = authors_formatted[authors_formatted["last_name"] == selection]
-        #? Problem: all of the apply and drop fails if there is an empty DF returned from the selection filter
-        if not authors_formatted.empty:
-            authors_formatted["Author"] = authors_formatted.apply(lambda row: self.merge_names(row), axis=1)
-            authors_formatted.drop(columns=["first_name", "middle_name", "last_name", "suffix"], inplace=True)
-        else:
-            authors_formatted["Author"] = None
-            authors_formatted.drop(columns=["first_name", "middle_name", "last_name", "suffix"], inplace=True)
+            authors = authors[authors["last_name"] == selection]
+        authors_formatted = authors[["id"]].copy()
+        authors_formatted["Author"] = self.get_author_names().loc[authors.index]
         return(authors_formatted)
 
 
+    def get_author_names(self) -> Series:
+        """ Retrieve the formatted name of every author.
+
+        Retrieves the formatted author names, aligned with the index of the
+        authors table. The names are only generated once and then reused
+        until the authors table is modified.
+
+        Args:
+            self: Current CSVDataModel instance.
+
+        Returns:
+            author_names: Series of formatted author names.
+        """
+        authors_cache = self.cache.setdefault("authors", {})
+        if "names" not in authors_cache:
+            authors_cache["names"] = self.merge_names(self.model_data["authors"])
+        return(authors_cache["names"])
+
     def create_book_authors_merge(self) -> DataFrame:
         """ Merge formatted authors table into the books_authors mapping table
 
@@ -443,57 +526,77 @@ class CSVDataModel:
 
     ### ------------------ Data Processing and Management ----------------- ###
 
-    def merge_names(self, row: Series) -> str:
+    def merge_names(self, authors: Union[DataFrame, Series]
+                    ) -> Union[Series, str]:
         """ Merge name components into a final formatted name.
 
         Merge the four basic components of an author's name into a final
         formatted name. This method supports omitting different components
         while maintaining proper formatting (no extra spaces or punctuation).
+        The names for an entire authors table are merged at once using
+        vectorized string operations rather than row-by-row.
 
         Args:
             self: Current CSVDataModel instance.
-            row: The author row containing the four name components.
+            authors: The authors table, or a single author row, containing the
+                four name components.
         
         Returns:
-            final_name: The full author name string.
+            final_name: The full author names as a Series, or the full author
+                name string if a single row was given.
         """
-        final_name = ""
+        if isinstance(authors, Series):
+            return(self.merge_names(authors.to_frame().T).iloc[0])
 
-        if row.first_name != "":
-            final_name += row.first_name + " "
-        
-        if row.middle_name != "":
-            final_name += row.middle_name + " "
-        
-        if row.last_name != "":
-            final_name += row.last_name
+        name_cols = ["first_name", "middle_name", "last_name", "suffix"]
+        names = authors[name_cols].fillna("").astype(str)
+        first, middle, last, suffix = (names[col] for col in name_cols)
+
+        final_name = (first + " ").where(first != "", "")
+        final_name += (middle + " ").where(middle != "", "")
+        final_name += last
+        final_name += (", " + suffix).where(suffix != "", "")
 
-        if row.suffix != "":
-            final_name += ", " + row.suffix
-        
         return(final_name)
 
 
-    def check_all_in_set(self, start_list: List, target_set: Set) -> bool:
-        """ Checks if all elements of a list exists in another set
+    def calculate_read_time(self, reading: DataFrame) -> Series:
+        """ Calculate the reading time for every reading entry.
 
-        Checks if all of the elements in a starting list exist in another set.
-        If this is not the case, then the method returns false.
+        Calculates the number of days between the start and finish dates for
+        all entries at once using datetime64 arithmetic. Entries that are
+        missing either date have a missing reading time.
 
         Args:
             self: Current CSVDataModel instance.
-            start_list: List of elements to check.
-            target_set: Set of elements to check against.
+            reading: Reading entries with datetime64 "start_date" and
+                "finish_date" columns.
 
         Returns:
-            (bool): True if all elements in the start_list exist in the
-                target_set.
+            read_time: The reading time (in days) of each entry.
         """
-        is_in_set = False
-        for element in start_list:
-            if element in target_set:
-                is_in_set = True
-        return(is_in_set)
+        return((reading["finish_date"] - reading["start_date"]).dt.days)
+
+
+    def get_linked_books(self, table: str, column: str,
+                         id_list: List[int]) -> Series:
+        """ Retrieve the ID's of books linked to any of the given ID's
+
+        Looks up the books linked to any of the given author/genre ID's
+        directly in a mapping table. This is used to filter the main views
+        with a single vectorized lookup rather than checking every row.
+
+        Args:
+            self: Current CSVDataModel instance.
+            table: Name of the mapping table (e.g. "books_authors").
+            column: Column of the mapping table holding the given ID's.
+            id_list: List of ID's to search for.
+
+        Returns:
+            Series containing the ID's of the linked books.
+        """
+        links = self.model_data[table]
+        return(links.loc[links[column].isin(id_list), "book_id"])
 
 
     def date_filter(self, data: DataFrame, column: str,
@@ -517,6 +620,8 @@ class CSVDataModel:
             data_filter: A Series containing the Boolean filter for the
                 comparison.
         """
+        thresholds = [pd.Timestamp(threshold) for threshold in thresholds]
+
         if comp_type == 1:
             data_filter = data[column] >= thresholds[0]
         elif comp_type == 2:
@@ -526,8 +631,7 @@ class CSVDataModel:
             upper_filter = data[column] <= thresholds[1]
             data_filter = lower_filter & upper_filter
         elif comp_type == 4:
-            data_filter = pd.to_datetime(data[column]).dt.year == \
-                thresholds[0].year
+            data_filter = data[column].dt.year == thresholds[0].year
         else:  # comp_type == 5
             data_filter = data[column].isnull()
         
@@ -576,43 +680,157 @@ class CSVDataModel:
         Todo:
             * Complete Documentation
         """
+        return(self.generate_ids(table, 1)[0])
+
+    def generate_ids(self, table: str, count: int) -> List[int]:
+        """ Generate several new IDs by comparing to existing ID's.
+
+        Generates new entry IDs using the same approach as generate_id, while
+        only collecting the existing ID's once for the whole batch.
 
+        Args:
+            self: Current CSVDataModel instance.
+            table: Name of the table to generate IDs for.
+            count: Number of IDs to generate.
+
+        Returns:
+            new_ids: List of unused entry IDs.
+        """
         id_set = set(self.model_data[table]["id"])
+        new_ids = []
         new_id = 1
 
-        while new_id in id_set:
+        while len(new_ids) < count:
+            if new_id not in id_set:
+                new_ids.append(new_id)
             new_id += 1
 
-        return(new_id)
+        return(new_ids)
             
+    def locate_entries(self, table: str, column: str, value) -> pd.Index:
+        """ Locate the rows of a table matching a given value
+
+        Compares the underlying array of a column against the given value and
+        returns the index labels of the matching rows. Comparing the raw
+        array skips the overhead of building an intermediate boolean Series.
+
+        Args:
+            self: Current CSVDataModel instance.
+            table: Name of the table to search.
+            column: Column to compare against.
+            value: Value to search for.
+
+        Returns:
+            Index labels of all matching rows.
+        """
+        data = self.model_data[table]
+        return(data.index[data[column].values == value])
+
+    def invalidate_cache(self, table: str):
+        """ Drop any cached values derived from a table
+
+        Args:
+            self: Current CSVDataModel instance.
+            table: Name of the table that was modified.
+        """
+        self.cache.pop(table, None)
+
+    def mark_modified(self, table: str):
+        """ Mark a table as modified
+
+        Drops any cached values derived from the table and flags it to be
+        written to its CSV on the next save.
+
+        Args:
+            self: Current CSVDataModel instance.
+            table: Name of the table that was modified.
+        """
+        self.invalidate_cache(table)
+        self.dirty.add(table)
+
+    def save(self):
+        """ Save all modified tables to their CSVs
+
+        Writes every table modified since the last save to its CSV. Tables
+        that were not modified are not rewritten.
+
+        Args:
+            self: Current CSVDataModel instance.
+        """
+        for table in sorted(self.dirty):
+            self.model_data[table].to_csv(self.model_paths[table], index=False)
+        self.dirty.clear()
+
     def add_entry(self, table: str, entry_details: dict) -> Union[int, None]:
-        if table in {"books", "authors", "genres", "series", "reading"}:
-            entry_details["id"] = self.generate_id(table)
+        new_ids = self.add_entries(table, [entry_details])
+        if new_ids is not None:
+            return(new_ids[0])
 
-        self.model_data[table] = self.model_data[table].append(\
-            entry_details, ignore_index=True)
-        self.model_data[table].to_csv(self.model_paths[table], index=False)
-        if table in {"books", "authors", "genres", "series", "reading"}:
-            return(entry_details["id"])
+    def add_entries(self, table: str,
+                    entries: List[dict]) -> Union[List[int], None]:
+        """ Adds several new entries to a table at once
+
+        Adds a batch of new entries to a table using a single concatenation
+        rather than once per entry. The table is written on the next save.
+
+        Args:
+            self: Current CSVDataModel instance.
+            table: Name of the table to add the entries to.
+            entries: List of dictionaries mapping column names to values.
+
+        Returns:
+            The IDs of the new entries, in order, for tables that use IDs.
+        """
+        has_ids = table in {"books", "authors", "genres", "series", "reading"}
+        if has_ids:
+            new_ids = self.generate_ids(table, len(entries))
+            for entry_details, new_id in zip(entries, new_ids):
+                entry_details["id"] = new_id
+
+        self.model_data[table] = pd.concat(\
+            [self.model_data[table], pd.DataFrame(entries)],
+            ignore_index=True)
+        self.model_data[table] = self.cast_columns(table,
+                                                   self.model_data[table])
+        self.mark_modified(table)
+        if has_ids:
+            return(new_ids)
 
     def edit_entry(self, table: str, id_column: str, id_value: int, new_column: str, new_val):
         """ Edits an existing entry
 
-        Edits an existing entry and saves the edit to the CSV
+        Edits an existing entry. The table is written on the next save and is
+        not marked as modified if the new value is the same as the current
+        value.
 
         """
-        # Get position based on id_column and entry_id
-        pos = self.model_data[table][self.model_data[table][id_column]\
-             == id_value].index[0]
+        pos = self.locate_entries(table, id_column, id_value)[0]
+
+        # Dates may be given as strings, so compare them as Timestamps
+        if new_column in self.date_columns.get(table, []):
+            new_val = pd.to_datetime(new_val)
+
+        current_val = self.model_data[table].at[pos, new_column]
+        if pd.isna(current_val) or pd.isna(new_val):
+            unchanged = pd.isna(current_val) and pd.isna(new_val)
+        else:
+            unchanged = current_val == new_val
+        if unchanged:
+            return
+
         self.model_data[table].at[pos, new_column] = new_val
-        self.model_data[table].to_csv(self.model_paths[table], index=False)
+        self.model_data[table] = self.cast_columns(table,
+                                                   self.model_data[table])
+        self.mark_modified(table)
 
 
     def delete_entry(self, table, id_column, id_value):
-        to_delete = self.model_data[table][self.model_data[table][id_column]\
-            == id_value].index
+        to_delete = self.locate_entries(table, id_column, id_value)
+        if to_delete.empty:
+            return
+
         self.model_data[table].drop(to_delete, inplace=True)  # type: ignore
-        self.model_data[table].to_csv(self.model_paths[table], index=False)
+        self.mark_modified(table)
 
     # def delete_entry(self, table: str, id_value):
     #     """ Controls delete cascades
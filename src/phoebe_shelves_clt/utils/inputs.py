@@ -13,6 +13,40 @@ import pandas as pd
 import dateutil
 
 
+def format_choices(choices: List[Any], zero_indexed: bool = False) -> str:
+    """ Format a list of choices as a numbered selection prompt
+
+    Args:
+        choices: List of choices to present to the user
+        zero_indexed: Flag to indicate whether to use zero-indexing for options
+
+    Returns:
+        prompt (str): Prompt listing each choice with its selection index
+    """
+    start = 0 if zero_indexed else 1
+    prompt_list = [f"[{index}] {value}"
+                   for index, value
+                   in enumerate(choices, start)]
+    return("\n".join(prompt_list) + "\nSelection: ")
+
+
+# Properties that can be edited in either backend, with their selection
+# prompts formatted once
+AUTHOR_PROPS = {
+    "First Name": "first_name",
+    "Middle Name": "middle_name",
+    "Last Name": "last_name",
+    "Suffix": "suffix"
+}
+AUTHOR_PROPS_PROMPT = format_choices(list(AUTHOR_PROPS.keys()))
+
+BOOK_PROPS = ["Title", "Author", "Pages", "Rating", "Genre"]
+BOOK_PROPS_PROMPT = format_choices(BOOK_PROPS)
+
+READING_PROPS = ["Title", "Start", "Finish", "Rating"]
+READING_PROPS_PROMPT = format_choices(READING_PROPS)
+
+
 def prompt_from_choices(
         choices: List[Any],
         prompt: str = None,
@@ -42,10 +76,7 @@ def prompt_from_choices(
         choices_index = list(range(1, len(choices) + 1))
 
     if prompt is None:
-        prompt_list = [f"[{index}] {value}"
-                       for index, value
-                       in zip(choices_index, choices)]
-        prompt = "\n".join(prompt_list) + "\nSelection: "
+        prompt = format_choices(choices, zero_indexed)
 
     while True:
         try: